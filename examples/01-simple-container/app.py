@@ -1,15 +1,39 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse, Response
 import os
+import orjson
+import time
 from datetime import datetime
 
-app = FastAPI(title="Simple FastAPI Container", version="1.0.0")
+app = FastAPI(title="Simple FastAPI Container", version="1.0.0", default_response_class=ORJSONResponse)
+
+ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
+
+# Constant payloads, serialized once at import
+INFO_BYTES = orjson.dumps({
+    "app_name": "Simple FastAPI Container",
+    "version": "1.0.0",
+    "python_version": os.sys.version,
+    "environment": ENVIRONMENT
+})
+
+# Response timestamps are formatted at most once per second
+_ts_cache = ["", 0]
+
+def ts_now():
+    """Current local time as an ISO 8601 string, at one-second resolution"""
+    now = int(time.time())
+    if _ts_cache[1] != now:
+        _ts_cache[0] = datetime.fromtimestamp(now).isoformat()
+        _ts_cache[1] = now
+    return _ts_cache[0]
 
 @app.get("/")
 async def root():
     return {
         "message": "Hello from Docker!",
-        "timestamp": datetime.now().isoformat(),
-        "environment": os.getenv("ENVIRONMENT", "development")
+        "timestamp": ts_now(),
+        "environment": ENVIRONMENT
     }
 
 @app.get("/health")
@@ -18,9 +42,4 @@ async def health():
 
 @app.get("/info")
 async def info():
-    return {
-        "app_name": "Simple FastAPI Container",
-        "version": "1.0.0",
-        "python_version": os.sys.version,
-        "environment": os.getenv("ENVIRONMENT", "development")
-    }
+    return Response(INFO_BYTES, media_type="application/json")
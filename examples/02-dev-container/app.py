@@ -1,17 +1,42 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse, Response
 import os
+import orjson
 from datetime import datetime
 import time
 
-app = FastAPI(title="Development FastAPI Container", version="1.0.0")
+app = FastAPI(title="Development FastAPI Container", version="1.0.0", default_response_class=ORJSONResponse)
+
+ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
+HOT_RELOAD = os.getenv("ENVIRONMENT") == "development"
+
+# Constant payloads, serialized once at import (--reload re-imports on change)
+INFO_BYTES = orjson.dumps({
+    "app_name": "Development FastAPI Container",
+    "version": "1.0.0",
+    "python_version": os.sys.version,
+    "environment": ENVIRONMENT,
+    "working_directory": os.getcwd()
+})
+
+# Response timestamps are formatted at most once per second
+_ts_cache = ["", 0]
+
+def ts_now():
+    """Current local time as an ISO 8601 string, at one-second resolution"""
+    now = int(time.time())
+    if _ts_cache[1] != now:
+        _ts_cache[0] = datetime.fromtimestamp(now).isoformat()
+        _ts_cache[1] = now
+    return _ts_cache[0]
 
 @app.get("/")
 async def root():
     return {
         "message": "Hello from Development Docker!",
-        "timestamp": datetime.now().isoformat(),
-        "environment": os.getenv("ENVIRONMENT", "development"),
-        "hot_reload": "enabled" if os.getenv("ENVIRONMENT") == "development" else "disabled"
+        "timestamp": ts_now(),
+        "environment": ENVIRONMENT,
+        "hot_reload": "enabled" if HOT_RELOAD else "disabled"
     }
 
 @app.get("/health")
@@ -20,19 +45,13 @@ async def health():
 
 @app.get("/info")
 async def info():
-    return {
-        "app_name": "Development FastAPI Container",
-        "version": "1.0.0",
-        "python_version": os.sys.version,
-        "environment": os.getenv("ENVIRONMENT", "development"),
-        "working_directory": os.getcwd()
-    }
+    return Response(INFO_BYTES, media_type="application/json")
 
 @app.get("/debug")
 async def debug():
     """Debug endpoint to test hot reload"""
     return {
         "message": "This endpoint was modified for hot reload testing",
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": ts_now(),
         "process_id": os.getpid()
     }
@@ -1,32 +1,63 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 import os
 import logging
 import sys
-from datetime import datetime
+import atexit
+import queue
+from logging.handlers import QueueHandler, QueueListener
 import time
+from datetime import datetime
+import asyncio
 import random
 
 # Configure logging
+# The root logger only enqueues records (QueueHandler merges the message
+# arguments on the calling thread). A background thread applies the final
+# format and does the stdout/file writes, so disk I/O never blocks the
+# event loop.
+log_queue = queue.SimpleQueue()
+log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+log_handlers = [
+    logging.StreamHandler(sys.stdout),
+    logging.FileHandler('/app/logs/app.log')
+]
+for handler in log_handlers:
+    handler.setFormatter(log_formatter)
+
+log_listener = QueueListener(log_queue, *log_handlers, respect_handler_level=True)
+log_listener.start()
+atexit.register(log_listener.stop)
+
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('/app/logs/app.log')
-    ]
+    handlers=[QueueHandler(log_queue)]
 )
 
 logger = logging.getLogger(__name__)
 
-app = FastAPI(title="Logging FastAPI Container", version="1.0.0")
+app = FastAPI(title="Logging FastAPI Container", version="1.0.0", default_response_class=ORJSONResponse)
+
+ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
+
+# Response timestamps are formatted at most once per second
+_ts_cache = ["", 0]
+
+def ts_now():
+    """Current local time as an ISO 8601 string, at one-second resolution"""
+    now = int(time.time())
+    if _ts_cache[1] != now:
+        _ts_cache[0] = datetime.fromtimestamp(now).isoformat()
+        _ts_cache[1] = now
+    return _ts_cache[0]
 
 @app.get("/")
 async def root():
     logger.info("Root endpoint accessed")
     return {
         "message": "Hello from Logging Container!",
-        "timestamp": datetime.now().isoformat(),
-        "environment": os.getenv("ENVIRONMENT", "development")
+        "timestamp": ts_now(),
+        "environment": ENVIRONMENT
     }
 
 @app.get("/health")
@@ -41,7 +72,7 @@ async def info():
         "app_name": "Logging FastAPI Container",
         "version": "1.0.0",
         "python_version": os.sys.version,
-        "environment": os.getenv("ENVIRONMENT", "development"),
+        "environment": ENVIRONMENT,
         "log_level": logging.getLogger().level
     }
 
@@ -56,7 +87,7 @@ async def get_logs():
     
     return {
         "message": "Various log levels have been generated",
-        "timestamp": datetime.now().isoformat()
+        "timestamp": ts_now()
     }
 
 @app.get("/simulate-work")
@@ -65,17 +96,17 @@ async def simulate_work():
     logger.info("Starting work simulation")
     
     work_duration = random.randint(1, 5)
-    logger.info(f"Work will take {work_duration} seconds")
+    logger.info("Work will take %d seconds", work_duration)
     
     for i in range(work_duration):
-        logger.info(f"Working... step {i+1}/{work_duration}")
-        time.sleep(1)
+        logger.info("Working... step %d/%d", i + 1, work_duration)
+        await asyncio.sleep(1)
     
     logger.info("Work simulation completed")
     return {
         "message": "Work simulation completed",
         "duration": work_duration,
-        "timestamp": datetime.now().isoformat()
+        "timestamp": ts_now()
     }
 
 @app.get("/error")
@@ -7,10 +7,14 @@ This script demonstrates various cron job patterns in Docker.
 import os
 import sys
 import time
+import atexit
+import heapq
 import logging
 from datetime import datetime
-import json
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 
 # Configure logging
 logging.basicConfig(
@@ -24,6 +28,21 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Shared HTTP session so repeated probes reuse connections
+http_session = requests.Session()
+http_session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
+# Notification log, opened once and buffered; closed (and flushed) at exit
+notification_file = None
+
+def get_notification_file():
+    """Open the notification log on first use"""
+    global notification_file
+    if notification_file is None:
+        notification_file = open("/app/logs/notifications.log", 'ab', buffering=64 * 1024)
+        atexit.register(notification_file.close)
+    return notification_file
+
 def health_check():
     """Health check for external services"""
     logger.info("Starting health check...")
@@ -33,15 +52,35 @@ def health_check():
         {"name": "Database", "url": "http://localhost:5432"},
     ]
     
-    for service in services:
-        try:
-            response = requests.get(service["url"], timeout=5)
-            if response.status_code == 200:
-                logger.info(f"✓ {service['name']} is healthy")
-            else:
-                logger.warning(f"⚠ {service['name']} returned status {response.status_code}")
-        except Exception as e:
-            logger.error(f"✗ {service['name']} is down: {e}")
+    # Probe all services in parallel
+    with ThreadPoolExecutor(max_workers=len(services)) as executor:
+        list(executor.map(check_service, services))
+
+def check_service(service):
+    """Check a single service endpoint"""
+    try:
+        response = http_session.get(service["url"], timeout=5)
+        if response.status_code == 200:
+            logger.info("✓ %s is healthy", service['name'])
+        else:
+            logger.warning("⚠ %s returned status %s", service['name'], response.status_code)
+    except Exception as e:
+        logger.error("✗ %s is down: %s", service['name'], e)
+
+def iter_files(path):
+    """Recursively yield os.DirEntry objects for files under path"""
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from iter_files(entry.path)
+                elif not entry.is_dir():
+                    # Symlinks to directories are neither followed nor
+                    # listed as files, like os.walk
+                    yield entry
+    except OSError:
+        # Skip unreadable directories, like os.walk does
+        return
 
 def cleanup_temp_files():
     """Clean up temporary files"""
@@ -49,29 +88,28 @@ def cleanup_temp_files():
     
     temp_dirs = ["/tmp", "/app/temp"]
     cleaned_files = 0
+    cutoff = time.time() - 3600
     
     for temp_dir in temp_dirs:
         if os.path.exists(temp_dir):
-            for root, dirs, files in os.walk(temp_dir):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    try:
-                        # Remove files older than 1 hour
-                        if os.path.getmtime(file_path) < time.time() - 3600:
-                            os.remove(file_path)
-                            cleaned_files += 1
-                            logger.info(f"Removed old file: {file_path}")
-                    except Exception as e:
-                        logger.error(f"Failed to remove {file_path}: {e}")
-    
-    logger.info(f"Cleanup completed. Removed {cleaned_files} files.")
+            for entry in iter_files(temp_dir):
+                try:
+                    # Remove files older than 1 hour
+                    if entry.stat().st_mtime < cutoff:
+                        os.remove(entry.path)
+                        cleaned_files += 1
+                        logger.info("Removed old file: %s", entry.path)
+                except Exception as e:
+                    logger.error("Failed to remove %s: %s", entry.path, e)
+    
+    logger.info("Cleanup completed. Removed %d files.", cleaned_files)
 
 def generate_report():
     """Generate system report"""
     logger.info("Generating system report...")
     
     report = {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": datetime.now(),
         "environment": os.getenv("ENVIRONMENT", "development"),
         "python_version": sys.version,
         "working_directory": os.getcwd(),
@@ -83,10 +121,11 @@ def generate_report():
     report_file = f"/app/reports/report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
     os.makedirs(os.path.dirname(report_file), exist_ok=True)
     
-    with open(report_file, 'w') as f:
-        json.dump(report, f, indent=2)
+    # orjson emits bytes and serializes datetime values itself
+    with open(report_file, 'wb') as f:
+        f.write(orjson.dumps(report, option=orjson.OPT_INDENT_2))
     
-    logger.info(f"Report saved to: {report_file}")
+    logger.info("Report saved to: %s", report_file)
     return report_file
 
 def get_disk_usage():
@@ -101,18 +140,21 @@ def get_disk_usage():
             "percent_used": round((used / total) * 100, 2)
         }
     except Exception as e:
-        logger.error(f"Failed to get disk usage: {e}")
+        logger.error("Failed to get disk usage: %s", e)
         return None
 
 def get_memory_usage():
     """Get memory usage information"""
     try:
+        # Only the two fields we need, stop reading once both are found
         with open('/proc/meminfo', 'r') as f:
             meminfo = {}
             for line in f:
-                if ':' in line:
+                if line.startswith(("MemTotal:", "MemAvailable:")):
                     key, value = line.split(':', 1)
-                    meminfo[key.strip()] = value.strip()
+                    meminfo[key] = value.strip()
+                    if len(meminfo) == 2:
+                        break
         
         total_mem = int(meminfo['MemTotal'].split()[0])
         available_mem = int(meminfo['MemAvailable'].split()[0])
@@ -125,7 +167,7 @@ def get_memory_usage():
             "percent_used": round((used_mem / total_mem) * 100, 2)
         }
     except Exception as e:
-        logger.error(f"Failed to get memory usage: {e}")
+        logger.error("Failed to get memory usage: %s", e)
         return None
 
 def backup_data():
@@ -142,26 +184,29 @@ def backup_data():
     try:
         import tarfile
         
-        # Create tar.gz backup
-        with tarfile.open(backup_file, "w:gz") as tar:
+        # Create tar.gz backup (level 1: much faster than the default 9, slightly larger)
+        with tarfile.open(backup_file, "w:gz", compresslevel=1) as tar:
             tar.add("/app/data", arcname="data")
             tar.add("/app/logs", arcname="logs")
         
-        logger.info(f"Backup created: {backup_file}")
+        logger.info("Backup created: %s", backup_file)
         
-        # Clean old backups (keep last 5)
-        backup_files = sorted([f for f in os.listdir(backup_dir) if f.startswith("backup_")])
-        if len(backup_files) > 5:
-            for old_backup in backup_files[:-5]:
-                os.remove(os.path.join(backup_dir, old_backup))
-                logger.info(f"Removed old backup: {old_backup}")
+        # Clean old backups (keep last 5, names sort by timestamp)
+        with os.scandir(backup_dir) as it:
+            backups = [entry for entry in it if entry.name.startswith("backup_")]
+        if len(backups) > 5:
+            keep = {entry.name for entry in heapq.nlargest(5, backups, key=lambda entry: entry.name)}
+            for old_backup in backups:
+                if old_backup.name not in keep:
+                    os.remove(old_backup.path)
+                    logger.info("Removed old backup: %s", old_backup.name)
         
     except Exception as e:
-        logger.error(f"Backup failed: {e}")
+        logger.error("Backup failed: %s", e)
 
 def send_notification(message):
     """Send notification (simulated)"""
-    logger.info(f"Notification: {message}")
+    logger.info("Notification: %s", message)
     
     # In a real scenario, this would send to:
     # - Email (SMTP)
@@ -171,22 +216,19 @@ def send_notification(message):
     # - Push notification service
     
     notification = {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": datetime.now(),
         "message": message,
         "status": "sent"
     }
     
     # Save notification log
-    notification_file = "/app/logs/notifications.log"
-    with open(notification_file, 'a') as f:
-        f.write(json.dumps(notification) + '\n')
+    get_notification_file().write(orjson.dumps(notification) + b'\n')
 
 def main():
     """Main cron job function"""
     logger.info("=== Cron Job Started ===")
-    logger.info(f"Job type: {os.getenv('CRON_JOB_TYPE', 'default')}")
-    
     job_type = os.getenv('CRON_JOB_TYPE', 'default')
+    logger.info("Job type: %s", job_type)
     
     try:
         if job_type == 'health_check':
@@ -211,9 +253,10 @@ def main():
         
         logger.info("=== Cron Job Completed Successfully ===")
         send_notification(f"Cron job {job_type} completed successfully")
+        get_notification_file().flush()
         
     except Exception as e:
-        logger.error(f"Cron job failed: {e}")
+        logger.error("Cron job failed: %s", e)
         send_notification(f"Cron job {job_type} failed: {str(e)}")
         sys.exit(1)
 
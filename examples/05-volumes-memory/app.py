@@ -1,20 +1,40 @@
 from fastapi import FastAPI, HTTPException
+from fastapi.responses import ORJSONResponse
 import os
 import psutil
+import numpy as np
+import asyncio
 import json
 import time
 from datetime import datetime
 from pathlib import Path
 import shutil
+import functools
 
-app = FastAPI(title="Volumes and Memory Demo", version="1.0.0")
+app = FastAPI(title="Volumes and Memory Demo", version="1.0.0", default_response_class=ORJSONResponse)
+
+ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
+ENVIRONMENT_VARIABLES = {
+    name: os.getenv(name) for name in ("ENVIRONMENT", "MEMORY_LIMIT", "CPU_LIMIT")
+}
+
+# Response timestamps are formatted at most once per second
+_ts_cache = ["", 0]
+
+def ts_now():
+    """Current local time as an ISO 8601 string, at one-second resolution"""
+    now = int(time.time())
+    if _ts_cache[1] != now:
+        _ts_cache[0] = datetime.fromtimestamp(now).isoformat()
+        _ts_cache[1] = now
+    return _ts_cache[0]
 
 @app.get("/")
 async def root():
     return {
         "message": "Volumes and Memory Demo",
-        "timestamp": datetime.now().isoformat(),
-        "environment": os.getenv("ENVIRONMENT", "development")
+        "timestamp": ts_now(),
+        "environment": ENVIRONMENT
     }
 
 @app.get("/memory")
@@ -116,11 +136,7 @@ async def get_volume_info():
     
     return {
         "volumes": volumes,
-        "environment_variables": {
-            "ENVIRONMENT": os.getenv("ENVIRONMENT"),
-            "MEMORY_LIMIT": os.getenv("MEMORY_LIMIT"),
-            "CPU_LIMIT": os.getenv("CPU_LIMIT")
-        }
+        "environment_variables": ENVIRONMENT_VARIABLES
     }
 
 @app.post("/memory/allocate")
@@ -139,7 +155,7 @@ async def allocate_memory(size_mb: int = 100):
         
         return {
             "message": f"Allocated {size_mb}MB of memory",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": ts_now(),
             "memory_used": psutil.virtual_memory().used,
             "memory_percent": psutil.virtual_memory().percent
         }
@@ -157,13 +173,12 @@ async def fill_disk(size_mb: int = 10):
         test_file = "/app/data/test_file.bin"
         os.makedirs(os.path.dirname(test_file), exist_ok=True)
         
-        with open(test_file, 'wb') as f:
-            f.write(b'0' * (size_mb * 1024 * 1024))
+        await asyncio.to_thread(write_test_file, test_file, size_mb)
         
         return {
             "message": f"Created {size_mb}MB test file",
             "file_path": test_file,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": ts_now(),
             "disk_usage": get_directory_size("/app/data")
         }
     except OSError as e:
@@ -176,9 +191,9 @@ async def cleanup_disk():
         test_file = "/app/data/test_file.bin"
         if os.path.exists(test_file):
             os.remove(test_file)
-            return {"message": "Test file removed", "timestamp": datetime.now().isoformat()}
+            return {"message": "Test file removed", "timestamp": ts_now()}
         else:
-            return {"message": "No test file found", "timestamp": datetime.now().isoformat()}
+            return {"message": "No test file found", "timestamp": ts_now()}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -187,29 +202,47 @@ async def stress_test():
     """Run a stress test to demonstrate resource usage"""
     start_time = time.time()
     
-    # CPU stress
-    cpu_start = psutil.cpu_percent()
-    for i in range(1000000):
-        _ = i * i
-    
-    # Memory stress
-    memory_start = psutil.virtual_memory().percent
-    data = []
-    for i in range(10000):
-        data.append([i] * 100)
+    # Run in a worker thread so other requests are not blocked
+    cpu_usage, memory_usage = await asyncio.to_thread(run_stress_work)
     
     end_time = time.time()
     
     return {
         "message": "Stress test completed",
         "duration": end_time - start_time,
-        "cpu_usage": psutil.cpu_percent(),
-        "memory_usage": psutil.virtual_memory().percent,
-        "timestamp": datetime.now().isoformat()
+        "cpu_usage": cpu_usage,
+        "memory_usage": memory_usage,
+        "timestamp": ts_now()
     }
 
+# 1MB block reused for every write in write_test_file
+FILL_CHUNK = b'0' * (1024 * 1024)
+
+def write_test_file(path, size_mb):
+    """Write size_mb megabytes to path, one 1MB block at a time"""
+    with open(path, 'wb') as f:
+        for _ in range(size_mb):
+            f.write(FILL_CHUNK)
+
+def run_stress_work():
+    """CPU and memory stress work for /stress, returns (cpu_percent, memory_percent)"""
+    # CPU stress; the first cpu_percent() call starts the measurement
+    psutil.cpu_percent()
+    arr = np.arange(1_000_000, dtype=np.int64)
+    np.multiply(arr, arr, out=arr)
+    
+    # Memory stress: 10000 rows of 100 copies of the row index
+    data = np.repeat(np.arange(10_000, dtype=np.int64)[:, None], 100, axis=1)
+    
+    # Read usage while the stress data is still allocated
+    cpu_usage = psutil.cpu_percent()
+    memory_usage = psutil.virtual_memory().percent
+    del data
+    return cpu_usage, memory_usage
+
+@functools.lru_cache(maxsize=1)
 def get_memory_limit():
-    """Get container memory limit from cgroups"""
+    """Get container memory limit from cgroups (fixed for the container's lifetime)"""
     try:
         with open('/sys/fs/cgroup/memory/memory.limit_in_bytes', 'r') as f:
             return int(f.read().strip())
@@ -224,17 +257,30 @@ def get_cgroup_memory():
     except:
         return None
 
+def iter_files(path):
+    """Recursively yield os.DirEntry objects for files under path"""
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from iter_files(entry.path)
+                elif not entry.is_dir():
+                    # Symlinks to directories are neither followed nor
+                    # listed as files, like os.walk
+                    yield entry
+    except OSError:
+        # Skip unreadable directories, like os.walk does
+        return
+
 def get_directory_size(path):
     """Get directory size in bytes"""
     total_size = 0
     try:
-        for dirpath, dirnames, filenames in os.walk(path):
-            for filename in filenames:
-                filepath = os.path.join(dirpath, filename)
-                try:
-                    total_size += os.path.getsize(filepath)
-                except OSError:
-                    pass
+        for entry in iter_files(path):
+            try:
+                total_size += entry.stat().st_size
+            except OSError:
+                pass
         return total_size
     except:
         return 0
@@ -242,9 +288,6 @@ def get_directory_size(path):
 def count_files(path):
     """Count files in directory"""
     try:
-        count = 0
-        for root, dirs, files in os.walk(path):
-            count += len(files)
-        return count
+        return sum(1 for _ in iter_files(path))
     except:
         return 0
@@ -1,46 +1,181 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse, Response
 import os
-import redis
-import psycopg2
+import asyncio
+import asyncpg
+import redis.asyncio as aioredis
+import time
 from datetime import datetime
-import json
+import orjson
 
-app = FastAPI(title="Docker Compose Demo", version="1.0.0")
+app = FastAPI(title="Docker Compose Demo", version="1.0.0", default_response_class=ORJSONResponse)
+
+# Service configuration
+ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
+DB_HOST = os.getenv("DB_HOST", "postgres")
+DB_NAME = os.getenv("DB_NAME", "demo")
+DB_USER = os.getenv("DB_USER", "demo")
+DB_PASSWORD = os.getenv("DB_PASSWORD", "demo")
+REDIS_HOST = os.getenv("REDIS_HOST", "redis")
+REDIS_PORT = int(os.getenv("REDIS_PORT", "6379"))
+
+# Redis list holding the keys of the most recently stored entries
+REDIS_DATA_INDEX = "data:index"
+REDIS_DATA_INDEX_SIZE = 10
+
+# Constant /services payload, serialized once at import
+SERVICES_BYTES = orjson.dumps({
+    "fastapi": {
+        "status": "running",
+        "port": 8000,
+        "environment": ENVIRONMENT
+    },
+    "postgres": {
+        "host": DB_HOST,
+        "port": 5432,
+        "database": DB_NAME
+    },
+    "redis": {
+        "host": REDIS_HOST,
+        "port": REDIS_PORT
+    },
+    "nginx": {
+        "status": "proxy",
+        "port": 80
+    }
+})
+
+# Connection pools, shared by all requests
+app.state.pg = None
+db_pool_lock = asyncio.Lock()
+# Blocking pool: when all 32 connections are busy, wait for one instead of failing
+app.state.redis = aioredis.Redis(
+    connection_pool=aioredis.BlockingConnectionPool.from_url(
+        f"redis://{REDIS_HOST}:{REDIS_PORT}",
+        decode_responses=True,
+        max_connections=32,
+        timeout=5
+    )
+)
+
+async def init_db_connection(conn):
+    """Encode/decode JSONB with orjson (store_data relies on the encoder)"""
+    await conn.set_type_codec(
+        "jsonb",
+        encoder=lambda value: orjson.dumps(value).decode(),
+        decoder=orjson.loads,
+        schema="pg_catalog"
+    )
+
+async def init_db_pool():
+    """Create the PostgreSQL pool and the demo table on first use"""
+    if app.state.pg is None:
+        # Only one request creates the pool, the others wait and reuse it
+        async with db_pool_lock:
+            if app.state.pg is None:
+                db_pool = await asyncpg.create_pool(
+                    host=DB_HOST,
+                    database=DB_NAME,
+                    user=DB_USER,
+                    password=DB_PASSWORD,
+                    min_size=1,
+                    max_size=16,
+                    init=init_db_connection
+                )
+                try:
+                    async with db_pool.acquire() as conn:
+                        await conn.execute("""
+                            CREATE TABLE IF NOT EXISTS demo_data (
+                                id SERIAL PRIMARY KEY,
+                                data JSONB,
+                                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                            )
+                        """)
+                except Exception:
+                    await db_pool.close()
+                    raise
+                app.state.pg = db_pool
+    return app.state.pg
 
 # Database connection
-def get_db_connection():
+async def get_db_pool():
     try:
-        conn = psycopg2.connect(
-            host=os.getenv("DB_HOST", "postgres"),
-            database=os.getenv("DB_NAME", "demo"),
-            user=os.getenv("DB_USER", "demo"),
-            password=os.getenv("DB_PASSWORD", "demo")
-        )
-        return conn
+        return await init_db_pool()
     except Exception as e:
         print(f"Database connection error: {e}")
         return None
 
 # Redis connection
 def get_redis_connection():
+    return app.state.redis
+
+# Response timestamps are formatted at most once per second
+_ts_cache = ["", 0]
+
+def ts_now():
+    """Current local time as an ISO 8601 string, at one-second resolution"""
+    now = int(time.time())
+    if _ts_cache[1] != now:
+        _ts_cache[0] = datetime.fromtimestamp(now).isoformat()
+        _ts_cache[1] = now
+    return _ts_cache[0]
+
+@app.on_event("startup")
+async def startup():
+    await get_db_pool()
+
+@app.on_event("shutdown")
+async def shutdown():
+    if app.state.pg:
+        await app.state.pg.close()
+    await app.state.redis.aclose(close_connection_pool=True)
+
+async def check_db():
+    """Check that PostgreSQL answers a query"""
+    db_pool = await get_db_pool()
+    if not db_pool:
+        return "unhealthy"
+    try:
+        await db_pool.fetchval("SELECT 1")
+        return "healthy"
+    except Exception:
+        return "unhealthy"
+
+async def check_redis():
+    """Check that Redis answers a PING"""
     try:
-        r = redis.Redis(
-            host=os.getenv("REDIS_HOST", "redis"),
-            port=int(os.getenv("REDIS_PORT", "6379")),
-            decode_responses=True
-        )
-        r.ping()  # Test connection
-        return r
+        await get_redis_connection().ping()
+        return "healthy"
+    except Exception:
+        return "unhealthy"
+
+async def fetch_db_data():
+    """Get the latest rows from PostgreSQL"""
+    db_pool = await get_db_pool()
+    if not db_pool:
+        return []
+    try:
+        rows = await db_pool.fetch("SELECT data, created_at FROM demo_data ORDER BY created_at DESC LIMIT 10")
+        return [{"data": row[0], "created_at": row[1].isoformat()} for row in rows]
     except Exception as e:
-        print(f"Redis connection error: {e}")
-        return None
+        return [{"error": str(e)}]
+
+async def fetch_redis_data():
+    """Get the latest stored entries from Redis without scanning the keyspace"""
+    try:
+        r = get_redis_connection()
+        keys = await r.lrange(REDIS_DATA_INDEX, 0, REDIS_DATA_INDEX_SIZE - 1)
+        values = await r.mget(keys) if keys else []
+        return [{"key": key, "data": data} for key, data in zip(keys, values)]
+    except Exception as e:
+        return [{"error": str(e)}]
 
 @app.get("/")
 async def root():
     return {
         "message": "Docker Compose Demo",
-        "timestamp": datetime.now().isoformat(),
-        "environment": os.getenv("ENVIRONMENT", "development"),
+        "timestamp": ts_now(),
+        "environment": ENVIRONMENT,
         "services": ["fastapi", "postgres", "redis", "nginx"]
     }
 
@@ -51,68 +186,48 @@ async def health():
         "fastapi": "healthy",
         "database": "unknown",
         "redis": "unknown",
-        "timestamp": datetime.now().isoformat()
+        "timestamp": ts_now()
     }
     
-    # Check database
-    db_conn = get_db_connection()
-    if db_conn:
-        health_status["database"] = "healthy"
-        db_conn.close()
-    else:
-        health_status["database"] = "unhealthy"
-    
-    # Check Redis
-    redis_conn = get_redis_connection()
-    if redis_conn:
-        health_status["redis"] = "healthy"
-    else:
-        health_status["redis"] = "unhealthy"
+    # Check database and Redis concurrently
+    health_status["database"], health_status["redis"] = await asyncio.gather(
+        check_db(), check_redis()
+    )
     
     return health_status
 
 @app.get("/database")
 async def database_info():
     """Get database information"""
-    conn = get_db_connection()
-    if not conn:
+    db_pool = await get_db_pool()
+    if not db_pool:
         return {"error": "Database connection failed"}
     
     try:
-        cursor = conn.cursor()
-        cursor.execute("SELECT version();")
-        version = cursor.fetchone()[0]
-        
-        cursor.execute("SELECT current_database(), current_user;")
-        db_info = cursor.fetchone()
-        
+        async with db_pool.acquire() as conn:
+            db_info = await conn.fetchrow("SELECT version(), current_database(), current_user")
+    
         return {
             "status": "connected",
-            "version": version,
-            "database": db_info[0],
-            "user": db_info[1],
-            "timestamp": datetime.now().isoformat()
+            "version": db_info[0],
+            "database": db_info[1],
+            "user": db_info[2],
+            "timestamp": ts_now()
         }
     except Exception as e:
         return {"error": str(e)}
-    finally:
-        conn.close()
 
 @app.get("/redis")
 async def redis_info():
     """Get Redis information"""
-    r = get_redis_connection()
-    if not r:
-        return {"error": "Redis connection failed"}
-    
     try:
-        info = r.info()
+        info = await get_redis_connection().info()
         return {
             "status": "connected",
             "version": info.get("redis_version"),
             "uptime": info.get("uptime_in_seconds"),
             "memory": info.get("used_memory_human"),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": ts_now()
         }
     except Exception as e:
         return {"error": str(e)}
@@ -123,37 +238,29 @@ async def store_data(data: dict):
     result = {
         "database": "failed",
         "redis": "failed",
-        "timestamp": datetime.now().isoformat()
+        "timestamp": ts_now()
     }
     
     # Store in database
-    conn = get_db_connection()
-    if conn:
+    db_pool = await get_db_pool()
+    if db_pool:
         try:
-            cursor = conn.cursor()
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS demo_data (
-                    id SERIAL PRIMARY KEY,
-                    data JSONB,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            cursor.execute("INSERT INTO demo_data (data) VALUES (%s)", (json.dumps(data),))
-            conn.commit()
+            await db_pool.execute("INSERT INTO demo_data (data) VALUES ($1)", data)
             result["database"] = "success"
         except Exception as e:
             result["database"] = f"error: {str(e)}"
-        finally:
-            conn.close()
     
     # Store in Redis
-    r = get_redis_connection()
-    if r:
-        try:
-            r.set(f"data:{datetime.now().isoformat()}", json.dumps(data))
-            result["redis"] = "success"
-        except Exception as e:
-            result["redis"] = f"error: {str(e)}"
+    try:
+        key = f"data:{datetime.now().isoformat()}"  # Full precision, keys must be unique
+        async with get_redis_connection().pipeline() as pipe:
+            pipe.set(key, orjson.dumps(data))
+            pipe.lpush(REDIS_DATA_INDEX, key)
+            pipe.ltrim(REDIS_DATA_INDEX, 0, REDIS_DATA_INDEX_SIZE - 1)
+            await pipe.execute()
+        result["redis"] = "success"
+    except Exception as e:
+        result["redis"] = f"error: {str(e)}"
     
     return result
 
@@ -163,55 +270,17 @@ async def get_data():
     result = {
         "database": [],
         "redis": [],
-        "timestamp": datetime.now().isoformat()
+        "timestamp": ts_now()
     }
     
-    # Get from database
-    conn = get_db_connection()
-    if conn:
-        try:
-            cursor = conn.cursor()
-            cursor.execute("SELECT data, created_at FROM demo_data ORDER BY created_at DESC LIMIT 10")
-            rows = cursor.fetchall()
-            result["database"] = [{"data": row[0], "created_at": row[1].isoformat()} for row in rows]
-        except Exception as e:
-            result["database"] = [{"error": str(e)}]
-        finally:
-            conn.close()
-    
-    # Get from Redis
-    r = get_redis_connection()
-    if r:
-        try:
-            keys = r.keys("data:*")
-            for key in keys[:10]:  # Limit to 10 items
-                data = r.get(key)
-                result["redis"].append({"key": key, "data": data})
-        except Exception as e:
-            result["redis"] = [{"error": str(e)}]
+    # Get from database and Redis concurrently
+    result["database"], result["redis"] = await asyncio.gather(
+        fetch_db_data(), fetch_redis_data()
+    )
     
     return result
 
 @app.get("/services")
 async def services_info():
     """Get information about all services"""
-    return {
-        "fastapi": {
-            "status": "running",
-            "port": 8000,
-            "environment": os.getenv("ENVIRONMENT", "development")
-        },
-        "postgres": {
-            "host": os.getenv("DB_HOST", "postgres"),
-            "port": 5432,
-            "database": os.getenv("DB_NAME", "demo")
-        },
-        "redis": {
-            "host": os.getenv("REDIS_HOST", "redis"),
-            "port": int(os.getenv("REDIS_PORT", "6379"))
-        },
-        "nginx": {
-            "status": "proxy",
-            "port": 80
-        }
-    }
+    return Response(SERVICES_BYTES, media_type="application/json")
@@ -1,17 +1,71 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse, Response
 import os
 import sys
+import time
 from datetime import datetime
-import json
+import orjson
 
-app = FastAPI(title="Multi-Stage Build Demo", version="1.0.0")
+app = FastAPI(title="Multi-Stage Build Demo", version="1.0.0", default_response_class=ORJSONResponse)
+
+ENVIRONMENT = os.getenv("ENVIRONMENT", "production")
+
+# Response timestamps are formatted at most once per second
+_ts_cache = ["", 0]
+
+def ts_now():
+    """Current local time as an ISO 8601 string, at one-second resolution"""
+    now = int(time.time())
+    if _ts_cache[1] != now:
+        _ts_cache[0] = datetime.fromtimestamp(now).isoformat()
+        _ts_cache[1] = now
+    return _ts_cache[0]
+
+def json_prefix(payload):
+    """Serialize the constant fields once, leaving the object open for a timestamp"""
+    return orjson.dumps(payload)[:-1] + b',"timestamp":'
+
+def timestamped_response(prefix):
+    """Close a json_prefix() payload with the current timestamp"""
+    content = prefix + orjson.dumps(ts_now()) + b"}"
+    return Response(content, media_type="application/json")
+
+BUILD_INFO_PREFIX = json_prefix({
+    "build_stage": "runtime",
+    "python_version": sys.version,
+    "environment": ENVIRONMENT,
+    "optimizations": [
+        "Multi-stage build",
+        "Minimal runtime image",
+        "No build dependencies",
+        "Security hardened"
+    ]
+})
+
+DEPENDENCIES_PREFIX = json_prefix({
+    "runtime_dependencies": [
+        "fastapi",
+        "uvicorn",
+        "orjson",
+        "python"
+    ],
+    "build_dependencies_removed": [
+        "build-essential",
+        "gcc",
+        "g++",
+        "make",
+        "pkg-config",
+        "development packages"
+    ],
+    "image_size_optimized": True
+})
 
 @app.get("/")
 async def root():
     return {
         "message": "Multi-Stage Build Demo",
-        "timestamp": datetime.now().isoformat(),
-        "environment": os.getenv("ENVIRONMENT", "production"),
+        "timestamp": ts_now(),
+        "environment": ENVIRONMENT,
         "python_version": sys.version,
         "build_info": {
             "stage": "runtime",
@@ -25,42 +79,15 @@ async def health():
     return {
         "status": "healthy",
         "service": "multi-stage-fastapi",
-        "timestamp": datetime.now().isoformat()
+        "timestamp": ts_now()
     }
 
 @app.get("/build-info")
 async def build_info():
     """Get information about the build process"""
-    return {
-        "build_stage": "runtime",
-        "python_version": sys.version,
-        "environment": os.getenv("ENVIRONMENT", "production"),
-        "optimizations": [
-            "Multi-stage build",
-            "Minimal runtime image",
-            "No build dependencies",
-            "Security hardened"
-        ],
-        "timestamp": datetime.now().isoformat()
-    }
+    return timestamped_response(BUILD_INFO_PREFIX)
 
 @app.get("/dependencies")
 async def dependencies():
     """Show runtime dependencies"""
-    return {
-        "runtime_dependencies": [
-            "fastapi",
-            "uvicorn",
-            "python"
-        ],
-        "build_dependencies_removed": [
-            "build-essential",
-            "gcc",
-            "g++",
-            "make",
-            "pkg-config",
-            "development packages"
-        ],
-        "image_size_optimized": True,
-        "timestamp": datetime.now().isoformat()
-    }
+    return timestamped_response(DEPENDENCIES_PREFIX)